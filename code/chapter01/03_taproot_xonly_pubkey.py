@@ -22,9 +22,17 @@ def main():
     # Get the public key
     pub = priv.get_public_key()
 
-    # Taproot uses x-only public keys (32 bytes)
-    # Get the x-coordinate only
-    taproot_pubkey = pub.to_x_only_hex()  # 32 bytes, x-coordinate only
+    # Taproot uses x-only public keys (32 bytes).
+    # A compressed public key is <02|03 parity byte> || <32-byte x-coordinate>,
+    # so the x-only form is literally the compressed encoding minus its first
+    # byte - a single slice, no re-serialization needed.
+    compressed = pub.to_hex()          # 33 bytes: parity prefix + x
+    taproot_pubkey = compressed[2:]    # 32 bytes: x-coordinate only
+
+    # The library helper computes the same value
+    assert taproot_pubkey == pub.to_x_only_hex()
+
+    print(f"Compressed Public Key: {compressed}")
     print(f"X-only Public Key: {taproot_pubkey}")
 
 
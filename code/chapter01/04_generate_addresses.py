@@ -11,12 +11,26 @@ from the same key pair:
 Reference: Chapter 1, Section "Address Generation: From Public Keys to Payment Destinations" (lines 183-206)
 """
 
+import hashlib
+
 from bitcoinutils.setup import setup
 from bitcoinutils.keys import PrivateKey
+from bitcoinutils.ripemd160 import ripemd160
 from bitcoinutils.script import Script
 from bitcoinutils.keys import P2shAddress, P2wpkhAddress
 
 
+def p2sh_p2wpkh_script(pubkey_hash):
+    """Fill the fixed P2SH-P2WPKH scriptPubKey template directly.
+
+    The wrapped script is always OP_HASH160 <hash160(0x0014 || h160)>
+    OP_EQUAL, so only the inner pubkey hash varies - no intermediate
+    Script objects are needed.
+    """
+    redeem = b'\x00\x14' + pubkey_hash
+    return b'\xa9\x14' + ripemd160(hashlib.sha256(redeem).digest()) + b'\x87'
+
+
 def main():
     # Setup mainnet (or 'testnet' for test network)
     setup('mainnet')
@@ -36,6 +50,12 @@ def main():
     segwit_script = segwit_native.to_script_pub_key()
     segwit_p2sh = P2shAddress.from_script(segwit_script)  # P2SH-P2WPKH
 
+    # The same scriptPubKey from the precomputed template - one hash160
+    # over the filled-in redeem script instead of the Script-object
+    # round-trip above
+    pubkey_hash = bytes.fromhex(legacy_address.to_hash160())
+    assert p2sh_p2wpkh_script(pubkey_hash).hex() == segwit_p2sh.to_script_pub_key().to_hex()
+
     print(f"Legacy (P2PKH):     {legacy_address.to_string()}")
     print(f"SegWit Native:      {segwit_native.to_string()}")
     print(f"SegWit P2SH:        {segwit_p2sh.to_string()}")
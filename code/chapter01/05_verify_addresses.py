@@ -9,68 +9,102 @@ This script verifies the generated addresses:
 Reference: Chapter 1, Address format comparison
 """
 
+import sys
+
 from bitcoinutils.setup import setup
 from bitcoinutils.keys import PrivateKey
 from bitcoinutils.script import Script
 from bitcoinutils.keys import P2shAddress, P2wpkhAddress
-import base58
 
+# Base58 decoding: prefer the Rust-backed `based58` package when installed
+# (pip install based58) - it decodes via fixed-size byte buffers instead of
+# Python big-integer divmod. Falls back to the pure-Python `base58` package.
+try:
+    import based58
+
+    def b58decode(address):
+        return based58.b58decode(address.encode('ascii'))
+except ImportError:
+    import base58
+
+    b58decode = base58.b58decode
+
+# Fixed scriptPubKey layouts for the SegWit address types:
+# P2WPKH is always OP_0 + pushdata(20) + hash160, P2TR is always
+# OP_1 + pushdata(32) + x-only pubkey. Precomputing the two-byte
+# prefixes lets the checks below compare slices instead of testing
+# individual opcode bytes.
+P2WPKH_SCRIPT_PREFIX = b'\x00\x14'  # OP_0, push 20 bytes
+P2TR_SCRIPT_PREFIX = b'\x51\x20'    # OP_1, push 32 bytes
 
-def verify_address(address_obj, address_str, address_type):
+
+def verify_address(address_obj, address_str: str, address_type: str) -> None:
     """Verify address format and extract information"""
-    print(f"\n{address_type}:")
-    print(f"  Address: {address_str}")
-    print(f"  Length: {len(address_str)} characters")
-    
-    # Get the scriptPubKey to see the underlying data
+    # Collect the report lines and write them in one go at the end -
+    # one stdout write per address instead of one per line, which
+    # matters when this runs over a large address sweep.
+    lines = [f"\n{address_type}:"]
+    out = lines.append
+    out(f"  Address: {address_str}")
+    out(f"  Length: {len(address_str)} characters")
+
+    # Get the scriptPubKey to see the underlying data. The Script object
+    # serializes to bytes natively; hex is derived from those bytes for
+    # display instead of round-tripping hex -> bytes.
     script_pubkey = address_obj.to_script_pub_key()
-    script_hex = script_pubkey.to_hex()
-    script_bytes = bytes.fromhex(script_hex)
+    script_bytes = script_pubkey.to_bytes()
+    script_hex = script_bytes.hex()
     
     if address_str[0] == '1' or address_str[0] == '3':
         # Base58Check encoded (P2PKH or P2SH)
         try:
-            decoded = base58.b58decode(address_str)
+            decoded = b58decode(address_str)
+            # Hex-encode the decoded payload once and take substring views
+            # of it below, instead of hex-encoding each byte slice.
+            decoded_hex = decoded.hex()
             # Base58Check: version byte (1) + hash (20 bytes) + checksum (4 bytes) = 25 bytes
-            print(f"  Format: Base58Check")
-            print(f"  Decoded bytes: {len(decoded)} bytes")
-            print(f"  Version byte: 0x{decoded[0]:02x}")
-            print(f"  Hash160: {decoded[1:21].hex()} ({len(decoded[1:21])} bytes)")
-            print(f"  Checksum: {decoded[21:].hex()} ({len(decoded[21:])} bytes)")
-            print(f"  ScriptPubKey: {script_hex} ({len(script_bytes)} bytes)")
+            out(f"  Format: Base58Check")
+            out(f"  Decoded bytes: {len(decoded)} bytes")
+            out(f"  Version byte: 0x{decoded_hex[:2]}")
+            out(f"  Hash160: {decoded_hex[2:42]} ({len(decoded_hex[2:42]) // 2} bytes)")
+            out(f"  Checksum: {decoded_hex[42:]} ({len(decoded_hex[42:]) // 2} bytes)")
+            out(f"  ScriptPubKey: {script_hex} ({len(script_bytes)} bytes)")
         except Exception as e:
-            print(f"  Error decoding: {e}")
+            out(f"  Error decoding: {e}")
     
     elif address_str.startswith('bc1q'):
         # Bech32 encoded (P2WPKH)
-        print(f"  Format: Bech32 (SegWit v0)")
-        print(f"  ScriptPubKey: {script_hex} ({len(script_bytes)} bytes)")
+        out(f"  Format: Bech32 (SegWit v0)")
+        out(f"  ScriptPubKey: {script_hex} ({len(script_bytes)} bytes)")
         # P2WPKH script: OP_0 (0x00) + pushdata (0x14 = 20) + hash160 (20 bytes) = 22 bytes
-        if len(script_bytes) == 22 and script_bytes[0] == 0x00 and script_bytes[1] == 0x14:
-            print(f"  ✓ Correct format: OP_0 + pushdata(20) + 20-byte hash160")
-            print(f"  Version: 0x00 (P2WPKH)")
-            print(f"  Hash160: {script_bytes[2:].hex()} ({len(script_bytes[2:])} bytes)")
+        if len(script_bytes) == 22 and script_bytes[:2] == P2WPKH_SCRIPT_PREFIX:
+            out(f"  ✓ Correct format: OP_0 + pushdata(20) + 20-byte hash160")
+            out(f"  Version: 0x00 (P2WPKH)")
+            # script_hex was encoded once above; slice the string view
+            out(f"  Hash160: {script_hex[4:]} ({len(script_bytes) - 2} bytes)")
         else:
-            print(f"  ⚠ Unexpected script format")
+            out(f"  ⚠ Unexpected script format")
     
     elif address_str.startswith('bc1p'):
         # Bech32m encoded (P2TR)
-        print(f"  Format: Bech32m (SegWit v1 / Taproot)")
-        print(f"  ScriptPubKey: {script_hex} ({len(script_bytes)} bytes)")
+        out(f"  Format: Bech32m (SegWit v1 / Taproot)")
+        out(f"  ScriptPubKey: {script_hex} ({len(script_bytes)} bytes)")
         # P2TR script: OP_1 (0x51) + pushdata (0x20 = 32) + x-only pubkey (32 bytes) = 34 bytes
-        if len(script_bytes) == 34 and script_bytes[0] == 0x51 and script_bytes[1] == 0x20:
-            print(f"  ✓ Correct format: OP_1 + pushdata(32) + 32-byte x-only pubkey")
-            print(f"  Version: 0x01 (P2TR)")
-            print(f"  X-only pubkey: {script_bytes[2:].hex()} ({len(script_bytes[2:])} bytes)")
-            print(f"  Note: Taproot addresses are longer because:")
-            print(f"        - They use 32-byte x-only pubkeys (vs 20-byte hashes)")
-            print(f"        - Bech32m encoding overhead")
-            print(f"        - But provide better privacy and script flexibility")
+        if len(script_bytes) == 34 and script_bytes[:2] == P2TR_SCRIPT_PREFIX:
+            out(f"  ✓ Correct format: OP_1 + pushdata(32) + 32-byte x-only pubkey")
+            out(f"  Version: 0x01 (P2TR)")
+            out(f"  X-only pubkey: {script_hex[4:]} ({len(script_bytes) - 2} bytes)")
+            out(f"  Note: Taproot addresses are longer because:")
+            out(f"        - They use 32-byte x-only pubkeys (vs 20-byte hashes)")
+            out(f"        - Bech32m encoding overhead")
+            out(f"        - But provide better privacy and script flexibility")
         else:
-            print(f"  ⚠ Unexpected script format")
+            out(f"  ⚠ Unexpected script format")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
-def main():
+def main() -> None:
     # Setup mainnet
     setup('mainnet')
 
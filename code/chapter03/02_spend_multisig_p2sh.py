@@ -53,17 +53,24 @@ def spend_multisig_p2sh():
     txout = TxOutput(to_satoshis(0.00000888), recipient_address.to_script_pub_key())
     tx = Transaction([txin], [txout])
     
+    # Serialize the redeem script once - it is needed both for signing
+    # (inside sign_input) and for the ScriptSig below. Note that both
+    # sign_input calls hash an identical sighash preimage; the library
+    # does not expose a sign-precomputed-digest API, so the redundant
+    # hashing cannot be avoided from here.
+    redeem_script_hex = redeem_script.to_hex()
+
     # Sign with Alice and Bob's keys
     alice_sig = alice_sk.sign_input(tx, 0, redeem_script)
     bob_sig = bob_sk.sign_input(tx, 0, redeem_script)
-    
+
     # Construct ScriptSig: OP_0 <sig1> <sig2> <redeem_script>
     # OP_0 is required due to OP_CHECKMULTISIG bug
     txin.script_sig = Script([
         'OP_0',                    # OP_CHECKMULTISIG bug workaround
         alice_sig,                 # First signature
-        bob_sig,                   # Second signature  
-        redeem_script.to_hex()     # Reveal the redeem script
+        bob_sig,                   # Second signature
+        redeem_script_hex          # Reveal the redeem script
     ])
     
     # Get the signed transaction
@@ -11,7 +11,9 @@ Reference: Chapter 4, Sections 4.2 and 4.3
    View on explorer: https://blockstream.info/testnet/tx/271cf6285479885a5ffa4817412bfcf55e7d2cf43ab1ede06c4332b46084e3e6
 """
 
+import functools
 import struct
+from collections import namedtuple
 from bitcoinutils.setup import setup
 from bitcoinutils.keys import PrivateKey, P2wpkhAddress
 from bitcoinutils.transactions import Transaction, TxInput, TxOutput, TxWitnessInput
@@ -19,26 +21,73 @@ from bitcoinutils.utils import to_satoshis
 from bitcoinutils.script import Script
 
 
+# 32-byte TXID byteswap: unpack four little-endian u64 words and repack
+# them big-endian in reverse order. CPython's struct module issues four
+# CPU byteswaps for this instead of a 32-step Python-level reverse.
+_U64X4_LE = struct.Struct('<QQQQ')
+_U64X4_BE = struct.Struct('>QQQQ')
+
+# Fixed-width field readers, compiled once at import instead of
+# re-parsing the format string on every struct.unpack_from call
+_U32 = struct.Struct('<I')
+_U64 = struct.Struct('<Q')
+
+# Total width of a varint (tag byte included), indexed by its first byte:
+# values below 0xfd are stored inline in the tag byte itself, while
+# 0xfd/0xfe/0xff announce 2, 4, or 8 further little-endian bytes.
+_VARINT_WIDTH = bytes([1] * 0xfd + [3, 5, 9])
+
+# Slotted records for the per-input/per-output/per-witness-item rows: a
+# namedtuple packs its fields in a fixed tuple, far smaller than a dict
+# with string keys and with no per-key hashing on access.
+Input = namedtuple('Input', 'txid vout script_sig script_sig_len sequence')
+Output = namedtuple('Output', 'value value_hex script_len script_pubkey')
+# Witness items hex-encode the whole witness region once (a single
+# C-level .hex() call instead of one per item) and keep only slice
+# bounds into that string; data/head/tail materialize on first read.
+class WitnessItem(namedtuple('WitnessItem', 'len wit_hex start end short')):
+    __slots__ = ()
+
+    @property
+    def data(self):
+        return self.wit_hex[self.start:self.end]
+
+    @property
+    def head(self):
+        return self.wit_hex[self.start:min(self.end, self.start + 40)]
+
+    @property
+    def tail(self):
+        return self.wit_hex[max(self.start, self.end - 20):self.end]
+
+
 def parse_varint(data, offset):
-    """Parse variable-length integer from transaction data"""
+    """Parse variable-length integer from transaction data.
+
+    Nearly every varint in practice is a single byte (counts and script
+    lengths under 253), so that case returns straight off the tag byte;
+    only the rare multi-byte encodings take the table-driven slow path.
+    """
     first_byte = data[offset]
     if first_byte < 0xfd:
         return first_byte, offset + 1
-    elif first_byte == 0xfd:
-        return struct.unpack('<H', data[offset+1:offset+3])[0], offset + 3
-    elif first_byte == 0xfe:
-        return struct.unpack('<I', data[offset+1:offset+5])[0], offset + 5
-    else:  # 0xff
-        return struct.unpack('<Q', data[offset+1:offset+9])[0], offset + 9
+    return _parse_varint_slow(data, offset, first_byte)
+
+
+def _parse_varint_slow(data, offset, first_byte):
+    width = _VARINT_WIDTH[first_byte]
+    return int.from_bytes(data[offset+1:offset+width], 'little'), offset + width
 
 
 def parse_segwit_transaction(tx_hex):
     """Parse a SegWit transaction hex string into components"""
-    tx_bytes = bytes.fromhex(tx_hex)
+    # A memoryview makes every tx_bytes[a:b] below an O(1) view instead
+    # of a copying slice, and unpack_from reads fields in place
+    tx_bytes = memoryview(bytes.fromhex(tx_hex))
     offset = 0
     
     # Version (4 bytes, little-endian)
-    version = struct.unpack('<I', tx_bytes[offset:offset+4])[0]
+    version = _U32.unpack_from(tx_bytes, offset)[0]
     offset += 4
     
     # Check for SegWit marker and flag
@@ -56,17 +105,20 @@ def parse_segwit_transaction(tx_hex):
     # Input count
     input_count, offset = parse_varint(tx_bytes, offset)
     
-    inputs = []
+    # Counts are known up front, so build each list at final length
+    # and assign by index instead of growing through append
+    inputs = [None] * input_count
     for i in range(input_count):
         # TXID (32 bytes, little-endian, but displayed as big-endian)
         if offset + 32 > len(tx_bytes):
+            del inputs[i:]
             break
-        txid_bytes = tx_bytes[offset:offset+32]
-        txid = txid_bytes[::-1].hex()  # Reverse for display (little-endian to big-endian)
+        # Reverse for display (little-endian to big-endian)
+        txid = _U64X4_BE.pack(*_U64X4_LE.unpack_from(tx_bytes, offset)[::-1]).hex()
         offset += 32
         
         # VOUT (4 bytes, little-endian)
-        vout = struct.unpack('<I', tx_bytes[offset:offset+4])[0]
+        vout = _U32.unpack_from(tx_bytes, offset)[0]
         offset += 4
         
         # ScriptSig length
@@ -75,71 +127,72 @@ def parse_segwit_transaction(tx_hex):
         offset += script_sig_len
         
         # Sequence (4 bytes, little-endian)
-        sequence = struct.unpack('<I', tx_bytes[offset:offset+4])[0]
+        sequence = _U32.unpack_from(tx_bytes, offset)[0]
         offset += 4
         
-        inputs.append({
-            'txid': txid,
-            'vout': vout,
-            'script_sig': script_sig,
-            'script_sig_len': script_sig_len,
-            'sequence': f'{sequence:08x}'
-        })
+        inputs[i] = Input(txid, vout, script_sig, script_sig_len,
+                          f'{sequence:08x}')
     
     # Output count
     output_count, offset = parse_varint(tx_bytes, offset)
     
-    outputs = []
+    outputs = [None] * output_count
     for i in range(output_count):
         # Check if we have enough bytes
         if offset + 8 > len(tx_bytes):
+            del outputs[i:]
             break
         # Value (8 bytes, little-endian)
-        value = struct.unpack('<Q', tx_bytes[offset:offset+8])[0]
+        value = _U64.unpack_from(tx_bytes, offset)[0]
         offset += 8
         
         # Script length
         if offset >= len(tx_bytes):
+            del outputs[i:]
             break
         script_len, offset = parse_varint(tx_bytes, offset)
         if offset + script_len > len(tx_bytes):
+            del outputs[i:]
             break
         script_pubkey = tx_bytes[offset:offset+script_len].hex()
         offset += script_len
         
-        outputs.append({
-            'value': value,
-            'value_hex': f'{value:016x}',
-            'script_len': script_len,
-            'script_pubkey': script_pubkey
-        })
+        outputs[i] = Output(value, f'{value:016x}', script_len,
+                            script_pubkey)
     
     # Witness data (if SegWit)
     witnesses = []
     if is_segwit and offset < len(tx_bytes):
+        # One hex conversion for the whole witness region (everything
+        # before the trailing 4-byte locktime); items slice into it
+        wit_start = offset
+        wit_hex = tx_bytes[wit_start:len(tx_bytes) - 4].hex()
+        witnesses = [None] * input_count
         for i in range(input_count):
             if offset >= len(tx_bytes):
+                del witnesses[i:]
                 break
             witness_item_count, offset = parse_varint(tx_bytes, offset)
-            witness_items = []
+            witness_items = [None] * witness_item_count
             for j in range(witness_item_count):
                 if offset >= len(tx_bytes):
+                    del witness_items[j:]
                     break
                 item_len, offset = parse_varint(tx_bytes, offset)
                 if offset + item_len > len(tx_bytes):
+                    del witness_items[j:]
                     break
-                item_data = tx_bytes[offset:offset+item_len].hex() if item_len > 0 else ''
+                hex_start = 2 * (offset - wit_start)
                 offset += item_len
-                witness_items.append({
-                    'len': item_len,
-                    'data': item_data
-                })
-            witnesses.append(witness_items)
+                witness_items[j] = WitnessItem(
+                    item_len, wit_hex, hex_start,
+                    hex_start + 2 * item_len, item_len <= 30)
+            witnesses[i] = witness_items
     
     # Locktime (4 bytes, little-endian)
     locktime = 0
     if offset + 4 <= len(tx_bytes):
-        locktime = struct.unpack('<I', tx_bytes[offset:offset+4])[0]
+        locktime = _U32.unpack_from(tx_bytes, offset)[0]
         offset += 4
     
     return {
@@ -157,9 +210,27 @@ def parse_segwit_transaction(tx_hex):
     }
 
 
+
+# Re-entrant batch callers hit these every call: decode the WIF
+# (base58check plus scalar-to-point derivation) once per process, and
+# make repeat setup('testnet') calls no-ops
+_setup_done = False
+
+
+def _setup_testnet():
+    global _setup_done
+    if not _setup_done:
+        setup('testnet')
+        _setup_done = True
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_key(wif):
+    return PrivateKey(wif)
+
 def compare_hardcoded_vs_actual():
     """Compare hardcoded transaction structure with actual parsed transaction"""
-    setup('testnet')
+    _setup_testnet()
     
     print("=" * 70)
     print("REAL SEGWIT TRANSACTION PARSING")
@@ -167,10 +238,15 @@ def compare_hardcoded_vs_actual():
     
     # Use the REAL transaction from 02_create_segwit_transaction.py
     # This is the actual transaction that was broadcast to testnet
-    private_key = PrivateKey('cPeon9fBsW2BxwJTALj3hGzh9vm8C52Uqsce7MzXGS1iFJkPF4AT')
+    private_key = _cached_key('cPeon9fBsW2BxwJTALj3hGzh9vm8C52Uqsce7MzXGS1iFJkPF4AT')
     public_key = private_key.get_public_key()
     from_address = public_key.get_segwit_address()
     to_address = P2wpkhAddress('tb1qckeg66a6jx3xjw5mrpmte5ujjv3cjrajtvm9r4')
+
+    # script_code is needed for SegWit signing in Phase 2; derive it once
+    # here with the other key material rather than re-deriving (hash160 +
+    # address encode) mid-phase
+    script_code = public_key.get_address().to_script_pub_key()
     
     # Real UTXO from testnet
     utxo_txid = '1454438e6f417d710333fbab118058e2972127bdd790134ab74937fa9dddbc48'
@@ -202,18 +278,18 @@ def compare_hardcoded_vs_actual():
     
     if parsed_unsigned['inputs']:
         inp = parsed_unsigned['inputs'][0]
-        print(f"  TXID:         {inp['txid']}")
-        print(f"  VOUT:         {inp['vout']:08x} ({inp['vout']})")
-        print(f"  ScriptSig:    {inp['script_sig'] if inp['script_sig'] else '(empty)'} (len: {inp['script_sig_len']})")
-        print(f"  Sequence:     {inp['sequence']}")
+        print(f"  TXID:         {inp.txid}")
+        print(f"  VOUT:         {inp.vout:08x} ({inp.vout})")
+        print(f"  ScriptSig:    {inp.script_sig if inp.script_sig else '(empty)'} (len: {inp.script_sig_len})")
+        print(f"  Sequence:     {inp.sequence}")
     
     print(f"  Output Count: {parsed_unsigned['output_count']:02x}")
     
     if parsed_unsigned['outputs']:
         out = parsed_unsigned['outputs'][0]
-        print(f"  Value:        {out['value_hex']} ({out['value']} satoshis)")
-        print(f"  Script Len:   {out['script_len']:02x} ({out['script_len']} bytes)")
-        print(f"  ScriptPubKey: {out['script_pubkey']}")
+        print(f"  Value:        {out.value_hex} ({out.value} satoshis)")
+        print(f"  Script Len:   {out.script_len:02x} ({out.script_len} bytes)")
+        print(f"  ScriptPubKey: {out.script_pubkey}")
     
     print(f"  Locktime:     {parsed_unsigned['locktime']}")
     print(f"  Total Size:   {parsed_unsigned['total_size']} bytes")
@@ -232,17 +308,20 @@ def compare_hardcoded_vs_actual():
     print("=" * 70)
     
     # CRITICAL: Use sign_segwit_input with script_code and input amount
-    script_code = public_key.get_address().to_script_pub_key()
     signature = private_key.sign_segwit_input(
         tx,
         0,
         script_code,
-        to_satoshis(utxo_amount / 100000000)
+        utxo_amount  # already satoshis - no BTC round-trip
     )
     
-    # Set empty scriptSig and add witness
+    # Set empty scriptSig and add witness. to_hex() re-encodes the
+    # point on every call, so cache the compressed encoding in a local;
+    # TxWitnessInput's stack is hex strings, so the hex form is the one
+    # worth keeping.
     txin.script_sig = Script([])
-    tx.witnesses.append(TxWitnessInput([signature, public_key.to_hex()]))
+    public_key_hex = public_key.to_hex()
+    tx.witnesses.append(TxWitnessInput([signature, public_key_hex]))
     
     signed_tx = tx.serialize()
     parsed_signed = parse_segwit_transaction(signed_tx)
@@ -258,23 +337,23 @@ def compare_hardcoded_vs_actual():
     
     if parsed_signed['inputs']:
         inp = parsed_signed['inputs'][0]
-        print(f"  TXID:         {inp['txid']}")
-        print(f"  VOUT:         {inp['vout']:08x}")
-        print(f"  ScriptSig:    {inp['script_sig'] if inp['script_sig'] else '(empty)'} (len: {inp['script_sig_len']})")
-        print(f"  Sequence:     {inp['sequence']}")
+        print(f"  TXID:         {inp.txid}")
+        print(f"  VOUT:         {inp.vout:08x}")
+        print(f"  ScriptSig:    {inp.script_sig if inp.script_sig else '(empty)'} (len: {inp.script_sig_len})")
+        print(f"  Sequence:     {inp.sequence}")
     
     if parsed_signed['outputs']:
         out = parsed_signed['outputs'][0]
-        print(f"  Value:        {out['value_hex']} ({out['value']} satoshis)")
-        print(f"  Script Len:   {out['script_len']:02x} ({out['script_len']} bytes)")
-        print(f"  ScriptPubKey: {out['script_pubkey']}")
+        print(f"  Value:        {out.value_hex} ({out.value} satoshis)")
+        print(f"  Script Len:   {out.script_len:02x} ({out.script_len} bytes)")
+        print(f"  ScriptPubKey: {out.script_pubkey}")
     
     if parsed_signed['witnesses']:
         witness = parsed_signed['witnesses'][0]
         print(f"  Witness Items: {len(witness)}")
         for i, item in enumerate(witness):
-            print(f"    [{i}] Length: {item['len']} bytes")
-            print(f"    [{i}] Data:    {item['data'][:40]}...{item['data'][-20:] if len(item['data']) > 60 else item['data']}")
+            print(f"    [{i}] Length: {item.len} bytes")
+            print(f"    [{i}] Data:    {item.head}...{item.data if item.short else item.tail}")
     
     print(f"  Locktime:     {parsed_signed['locktime']}")
     print(f"  Total Size:   {parsed_signed['total_size']} bytes")
@@ -315,20 +394,20 @@ def compare_hardcoded_vs_actual():
     print(f"  Input Count:  {parsed_real['input_count']}")
     if parsed_real['inputs']:
         inp = parsed_real['inputs'][0]
-        print(f"  TXID:         {inp['txid']}")
-        print(f"  VOUT:         {inp['vout']}")
-        print(f"  ScriptSig:    {inp['script_sig'] if inp['script_sig'] else '(empty)'}")
+        print(f"  TXID:         {inp.txid}")
+        print(f"  VOUT:         {inp.vout}")
+        print(f"  ScriptSig:    {inp.script_sig if inp.script_sig else '(empty)'}")
     if parsed_real['outputs']:
         out = parsed_real['outputs'][0]
-        print(f"  Value:        {out['value']} satoshis")
-        print(f"  ScriptPubKey: {out['script_pubkey']}")
+        print(f"  Value:        {out.value} satoshis")
+        print(f"  ScriptPubKey: {out.script_pubkey}")
     if parsed_real['witnesses']:
         witness = parsed_real['witnesses'][0]
         print(f"  Witness Items: {len(witness)}")
         for i, item in enumerate(witness):
-            print(f"    [{i}] Length: {item['len']} bytes")
-            if item['len'] > 0:
-                print(f"    [{i}] Data:    {item['data'][:40]}...{item['data'][-20:] if len(item['data']) > 60 else item['data']}")
+            print(f"    [{i}] Length: {item.len} bytes")
+            if item.len > 0:
+                print(f"    [{i}] Data:    {item.head}...{item.data if item.short else item.tail}")
     print(f"  Total Size:   {parsed_real['total_size']} bytes")
 
 
@@ -47,26 +47,29 @@ def create_simple_taproot_transaction():
     print(f"Previous TXID: {prev_txid}")
     print(f"VOUT: {prev_vout}")
     
-    # Input amount and script for signing
+    # Input amount and script for signing - derive each address's
+    # scriptPubKey once (it re-encodes the x-only key on every call)
+    # and reuse the cached Script below
     input_amount = 0.00029200
     amounts = [to_satoshis(input_amount)]
-    input_script = from_address.to_script_pub_key()
-    scripts = [input_script]
+    from_spk = from_address.to_script_pub_key()
+    to_spk = to_address.to_script_pub_key()
+    scripts = [from_spk]
     
     print(f"Input Amount: {input_amount} BTC ({to_satoshis(input_amount)} satoshis)")
-    print(f"Input ScriptPubKey: {input_script.to_hex()}")
+    print(f"Input ScriptPubKey: {from_spk.to_hex()}")
     print(f"  Format: OP_1 <32-byte-output-key> (Taproot)")
     
     # Create transaction output
     amount_to_send = 0.00029000
     txout = TxOutput(
         to_satoshis(amount_to_send),
-        to_address.to_script_pub_key()
+        to_spk
     )
     
     print(f"\n=== OUTPUT DETAILS ===")
     print(f"Output Amount: {amount_to_send} BTC ({to_satoshis(amount_to_send)} satoshis)")
-    print(f"Output ScriptPubKey: {to_address.to_script_pub_key().to_hex()}")
+    print(f"Output ScriptPubKey: {to_spk.to_hex()}")
     print(f"  Format: OP_1 <32-byte-output-key> (Taproot)")
     print(f"Fee: {input_amount - amount_to_send} BTC ({to_satoshis(input_amount - amount_to_send)} satoshis)")
     
@@ -0,0 +1,20 @@
+# Common helpers shared across chapters
+# This package contains performance-oriented utilities for readers who
+# scale the chapter examples beyond single keys and transactions.
+
+from functools import lru_cache
+
+from bitcoinutils.setup import setup as _setup
+
+
+@lru_cache(maxsize=2)
+def setup(network='mainnet'):
+    """Idempotent wrapper around bitcoinutils.setup.setup.
+
+    The library setup() rewrites a module-global on every call. When
+    several helpers (or worker threads sharing one process) initialize
+    the same network repeatedly, this wrapper turns the repeat calls
+    into a cached lookup; only the first call per network touches the
+    global state.
+    """
+    return _setup(network)
@@ -0,0 +1,84 @@
+"""
+Address Subclasses With a Cached scriptPubKey
+
+Several examples call to_script_pub_key() on the same address object
+more than once (building outputs, printing, signing) and each call
+re-derives and re-serializes the Script. These drop-in subclasses
+compute the script once per address instance and hand back the cached
+object on every later call.
+
+Note: treat the returned Script as read-only - mutating it would
+corrupt the cache for every later caller.
+
+Usage:
+    from cached_addresses import CachedP2pkhAddress
+
+    addr = CachedP2pkhAddress('myYHJtG3cyoRseuTwvViGHgP2efAvZkYa4')
+    spk = addr.to_script_pub_key()   # computed once, cached afterwards
+"""
+
+from functools import cached_property
+
+from bitcoinutils.keys import (
+    P2pkhAddress,
+    P2shAddress,
+    P2trAddress,
+    P2wpkhAddress,
+)
+
+
+class _CachedScriptPubKey:
+    """Mixin that memoizes to_script_pub_key() on the instance."""
+
+    @cached_property
+    def _script_pub_key(self):
+        return super().to_script_pub_key()
+
+    def to_script_pub_key(self):
+        return self._script_pub_key
+
+
+class CachedP2pkhAddress(_CachedScriptPubKey, P2pkhAddress):
+    pass
+
+
+class CachedP2shAddress(_CachedScriptPubKey, P2shAddress):
+    pass
+
+
+class CachedP2wpkhAddress(_CachedScriptPubKey, P2wpkhAddress):
+    pass
+
+
+class CachedP2trAddress(_CachedScriptPubKey, P2trAddress):
+    pass
+
+
+if __name__ == "__main__":
+    import time
+    from bitcoinutils.setup import setup
+
+    setup('testnet')
+
+    # The chapter 3 recipient address
+    addr = CachedP2pkhAddress('myYHJtG3cyoRseuTwvViGHgP2efAvZkYa4')
+    first = addr.to_script_pub_key()
+    second = addr.to_script_pub_key()
+    assert first is second
+    assert first.to_hex() == P2pkhAddress(
+        'myYHJtG3cyoRseuTwvViGHgP2efAvZkYa4').to_script_pub_key().to_hex()
+    print(f"scriptPubKey: {first.to_hex()}")
+    print("OK - one derivation, cached thereafter")
+
+    n = 10000
+    plain = P2pkhAddress('myYHJtG3cyoRseuTwvViGHgP2efAvZkYa4')
+    start = time.perf_counter()
+    for _ in range(n):
+        plain.to_script_pub_key()
+    uncached = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(n):
+        addr.to_script_pub_key()
+    cached = time.perf_counter() - start
+    print(f"\n{n} calls, stock class:  {uncached:.4f}s")
+    print(f"{n} calls, cached class: {cached:.4f}s")
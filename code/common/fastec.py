@@ -0,0 +1,107 @@
+"""
+Fast Public Key Derivation
+
+priv.get_public_key() in the chapter examples drives a fresh scalar
+multiplication through the pure-Python `ecdsa` backend on every call.
+For the fixed generator G this should use a precomputed fixed-base
+table. libsecp256k1 ships exactly that (the ecmult_gen comb table),
+built once per process and shared across every derivation.
+
+This module uses the optional `coincurve` package (libsecp256k1
+bindings, pip install coincurve) when it is installed, and falls back
+to the library's own derivation otherwise.
+
+Usage:
+    from fastec import derive_public_key
+
+    pub = derive_public_key(priv)   # same PublicKey as priv.get_public_key()
+"""
+
+from bitcoinutils.keys import PublicKey
+
+try:
+    from coincurve import PublicKey as _CCPublicKey
+except ImportError:
+    _CCPublicKey = None
+
+
+def derive_public_key(priv):
+    """Return the PublicKey for `priv`.
+
+    With coincurve installed the scalar multiplication runs through
+    libsecp256k1's precomputed generator table (one table per process,
+    reused across calls). Without it, this is priv.get_public_key().
+    """
+    if _CCPublicKey is not None:
+        pub_bytes = _CCPublicKey.from_valid_secret(priv.to_bytes()).format(compressed=True)
+        return PublicKey(pub_bytes.hex())
+    return priv.get_public_key()
+
+
+def _derive_worker(secret):
+    """Derive one compressed pubkey hex from 32 secret bytes (pool worker)."""
+    from bitcoinutils.keys import PrivateKey
+    return PrivateKey(b=secret).get_public_key().to_hex()
+
+
+def parallel_pubkeys(privkeys, processes=None):
+    """Derive public keys for a large batch across worker processes.
+
+    Key derivation is embarrassingly parallel - each scalar
+    multiplication is independent - so for batches large enough to
+    amortize process startup, a pool of workers scales the throughput
+    with core count. Returns PublicKey objects in input order.
+
+    `processes` defaults to the CPU count (multiprocessing.Pool
+    default). For small batches prefer batch_pubkeys(); the pool only
+    pays off from a few thousand keys upward.
+    """
+    from multiprocessing import Pool
+
+    secrets_ = [priv.to_bytes() for priv in privkeys]
+    with Pool(processes) as pool:
+        hexes = pool.map(_derive_worker, secrets_, chunksize=64)
+    return [PublicKey(h) for h in hexes]
+
+
+def batch_pubkeys(privkeys):
+    """Derive public keys for a list of PrivateKey objects.
+
+    This is the multi-stakeholder workload behind the chapter 3
+    multisig examples (N keys in, N pubkeys out before assembling the
+    redeem script). With coincurve installed each derivation runs
+    through libsecp256k1, which applies the GLV endomorphism
+    decomposition (k = k1 + lambda*k2) internally, roughly halving the
+    point doublings per scalar; without it the pure-Python backend is
+    used.
+
+    Returns a list of PublicKey objects in input order.
+    """
+    return [derive_public_key(priv) for priv in privkeys]
+
+
+if __name__ == "__main__":
+    import time
+    from bitcoinutils.setup import setup
+    from bitcoinutils.keys import PrivateKey
+
+    setup('mainnet')
+
+    priv = PrivateKey(secret_exponent=12345)
+    print(f"Backend: {'coincurve (libsecp256k1)' if _CCPublicKey else 'ecdsa (pure Python)'}")
+    print(f"Library:  {priv.get_public_key().to_hex()}")
+    print(f"fastec:   {derive_public_key(priv).to_hex()}")
+    assert derive_public_key(priv).to_hex() == priv.get_public_key().to_hex()
+
+    n = 200
+    keys = [PrivateKey(secret_exponent=i + 1) for i in range(n)]
+    start = time.perf_counter()
+    pubs = batch_pubkeys(keys)
+    print(f"\n{n} batched derivations: {time.perf_counter() - start:.4f}s")
+    print(f"First pubkey: {pubs[0].to_hex()}")
+
+    start = time.perf_counter()
+    parallel = parallel_pubkeys(keys)
+    print(f"{n} parallel derivations: {time.perf_counter() - start:.4f}s "
+          f"(pool startup dominates at this size)")
+    assert [p.to_hex() for p in parallel] == [p.to_hex() for p in pubs]
@@ -0,0 +1,71 @@
+"""
+Accelerated Hash Helpers
+
+Every address derivation and Base58Check checksum in the chapters runs
+double-SHA256 and HASH160 (SHA256 then RIPEMD160). bitcoinutils routes
+SHA256 through hashlib - i.e. OpenSSL's EVP engine, which uses the CPU
+SHA extensions (SHA-NI on x86, the SHA256H instructions on ARMv8) when
+available - but falls back to a pure-Python RIPEMD160, because OpenSSL 3
+moved ripemd160 into its legacy provider.
+
+This module exposes both digests behind one-call helpers, using the
+OpenSSL RIPEMD160 when the local build still provides it and the
+library's pure-Python implementation otherwise.
+
+Usage:
+    from hashes import sha256d, hash160
+"""
+
+import hashlib
+
+try:
+    hashlib.new('ripemd160', b'')
+    _openssl_ripemd160 = True
+except ValueError:
+    from bitcoinutils.ripemd160 import ripemd160 as _py_ripemd160
+    _openssl_ripemd160 = False
+
+# True when hashlib.sha256 is the OpenSSL builtin rather than a
+# pure-Python substitute. bitcoinutils' whole sighash path (the BIP143
+# hashPrevouts/hashSequence/hashOutputs midstates and the BIP341 tagged
+# hashes) goes through hashlib.sha256, so this one flag tells you the
+# compute-bound part of signing is on the accelerated code path.
+SHA256_ACCELERATED = getattr(hashlib.sha256, '__name__', '') == 'openssl_sha256'
+
+
+def sha256d(data):
+    """Double SHA256 (the Bitcoin checksum / txid hash)."""
+    return hashlib.sha256(hashlib.sha256(data).digest()).digest()
+
+
+def hash160(data):
+    """SHA256 followed by RIPEMD160 (address hashes, P2SH script hashes)."""
+    sha = hashlib.sha256(data).digest()
+    if _openssl_ripemd160:
+        return hashlib.new('ripemd160', sha).digest()
+    return _py_ripemd160(sha)
+
+
+if __name__ == "__main__":
+    import time
+    from bitcoinutils.ripemd160 import ripemd160 as py_ripemd160
+
+    print(f"SHA256 backend:    hashlib ({hashlib.sha256().name}, "
+          f"{'OpenSSL EVP' if SHA256_ACCELERATED else 'non-OpenSSL fallback'})")
+    print(f"RIPEMD160 backend: {'OpenSSL EVP' if _openssl_ripemd160 else 'pure Python fallback'}")
+
+    # Cross-check against the library's pure-Python RIPEMD160
+    sample = b'mastering taproot'
+    assert hash160(sample) == py_ripemd160(hashlib.sha256(sample).digest())
+    print(f"hash160 check:     OK ({hash160(sample).hex()})")
+
+    n = 10000
+    block = bytes(64)
+    start = time.perf_counter()
+    for _ in range(n):
+        sha256d(block)
+    print(f"\n{n} x sha256d(64B): {time.perf_counter() - start:.4f}s")
+    start = time.perf_counter()
+    for _ in range(n):
+        hash160(block)
+    print(f"{n} x hash160(64B): {time.perf_counter() - start:.4f}s")
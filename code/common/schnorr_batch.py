@@ -0,0 +1,120 @@
+"""
+BIP340 Schnorr Batch Verification
+
+Verifying N Schnorr signatures one by one costs N independent
+[s]G - [e]P checks. BIP340 defines a batch form: scale each equation by
+a random coefficient a_i and verify the single combined identity
+
+    (sum a_i * s_i) * G  ==  sum a_i * R_i  +  sum (a_i * e_i) * P_i
+
+If any signature in the batch is invalid, the combined check fails
+except with negligible probability (the coefficients are unpredictable
+to a forger). This is the algorithm block validators run over every
+Schnorr signature in a block.
+
+This module implements it on the same pure-Python curve primitives
+bitcoinutils ships for its Taproot support (bitcoinutils.schnorr), so
+the demo can cross-check against the library's schnorr_verify. Honest
+caveat: the constant-factor speedup quoted for batch verification
+(~2x at N=100 and growing) comes from evaluating the combined sum with
+a multi-scalar multiplication (Strauss / Bos-Coster), which libsecp256k1
+provides and the affine point_add/point_mul here do not. This module
+keeps the batch algorithm and API correct; swap verify_batch's body for
+a libsecp256k1 binding when throughput matters.
+
+Usage:
+    from schnorr_batch import verify_batch
+
+    ok = verify_batch(pubkeys, msgs, sigs)   # x-only keys, 64-byte sigs
+"""
+
+import hashlib
+
+from bitcoinutils.schnorr import G, n, p, lift_x, point_add, point_mul, tagged_hash
+
+
+def _batch_coefficients(count, pubkeys, msgs, sigs):
+    """Derive the random scaling coefficients a_1..a_N.
+
+    BIP340 only requires them to be unpredictable to whoever produced
+    the signatures, so they are drawn from a SHA256 stream seeded with
+    every byte of the batch (synthetic randomness): a forger would have
+    to commit to the signatures before learning the coefficients. The
+    first coefficient is fixed to 1, as in the reference algorithm.
+    """
+    seed = hashlib.sha256(b''.join(pubkeys) + b''.join(msgs) + b''.join(sigs)).digest()
+    coefficients = [1]
+    for i in range(1, count):
+        digest = hashlib.sha256(seed + i.to_bytes(8, 'big')).digest()
+        coefficients.append(int.from_bytes(digest, 'big') % (n - 1) + 1)
+    return coefficients
+
+
+def verify_batch(pubkeys, msgs, sigs):
+    """Batch-verify BIP340 signatures; True iff every signature is valid.
+
+    `pubkeys` are 32-byte x-only public keys, `msgs` 32-byte messages,
+    `sigs` 64-byte (r || s) signatures, index-aligned. A False result
+    says at least one signature failed but not which - fall back to
+    per-signature schnorr_verify to locate it.
+    """
+    if not len(pubkeys) == len(msgs) == len(sigs):
+        raise ValueError("pubkeys, msgs and sigs must be index-aligned")
+    if not pubkeys:
+        return True
+
+    coefficients = _batch_coefficients(len(pubkeys), pubkeys, msgs, sigs)
+
+    lhs_scalar = 0
+    rhs = None  # point at infinity
+    for pk, msg, sig, a in zip(pubkeys, msgs, sigs, coefficients):
+        P = lift_x(int.from_bytes(pk, 'big'))
+        if P is None:
+            return False
+        r = int.from_bytes(sig[:32], 'big')
+        s = int.from_bytes(sig[32:], 'big')
+        if r >= p or s >= n:
+            return False
+        R = lift_x(r)
+        if R is None:
+            return False
+        e = int.from_bytes(
+            tagged_hash("BIP0340/challenge", sig[:32] + pk + msg), 'big') % n
+        lhs_scalar = (lhs_scalar + a * s) % n
+        rhs = point_add(rhs, point_mul(R, a))
+        rhs = point_add(rhs, point_mul(P, a * e % n))
+
+    return point_mul(G, lhs_scalar) == rhs
+
+
+if __name__ == "__main__":
+    import secrets
+    import time
+    from bitcoinutils.schnorr import schnorr_sign, schnorr_verify, pubkey_gen
+
+    count = 20
+    pubkeys, msgs, sigs = [], [], []
+    for _ in range(count):
+        seckey = secrets.token_bytes(32)
+        msg = secrets.token_bytes(32)
+        pubkeys.append(pubkey_gen(seckey))
+        msgs.append(msg)
+        sigs.append(schnorr_sign(msg, seckey, secrets.token_bytes(32)))
+
+    start = time.perf_counter()
+    assert all(schnorr_verify(m, pk, sg)
+               for pk, m, sg in zip(pubkeys, msgs, sigs))
+    serial = time.perf_counter() - start
+
+    start = time.perf_counter()
+    assert verify_batch(pubkeys, msgs, sigs)
+    batched = time.perf_counter() - start
+
+    # A single flipped bit anywhere in the batch must fail the check
+    bad_sigs = list(sigs)
+    bad_sigs[7] = bytes([bad_sigs[7][0] ^ 0x01]) + bad_sigs[7][1:]
+    assert not verify_batch(pubkeys, msgs, bad_sigs)
+
+    print(f"{count} signatures, one-by-one:   {serial:.4f}s")
+    print(f"{count} signatures, batch check:  {batched:.4f}s")
+    print("OK - batch accepts all-valid, rejects a tampered signature")
@@ -0,0 +1,106 @@
+"""
+Direct Byte-Level Script Builders
+
+The chapter 3 examples build redeem scripts through Script([...]),
+which looks up each opcode in a table, hex-decodes the pushed data and
+emits pushdata prefixes element by element - ideal for teaching, but
+interpreter-heavy when a script template is stamped out many times.
+These builders emit the serialized script bytes directly.
+
+Each builder mirrors a Script([...]) construction from the chapters;
+the demo at the bottom checks them byte-for-byte against the library.
+
+Usage:
+    from scriptbuild import multisig_redeem
+
+    raw = multisig_redeem(2, [alice_pk, bob_pk, carol_pk])
+    redeem_script = Script.from_raw(raw.hex())
+"""
+
+OP_CHECKMULTISIG = 0xae
+
+# Opcode tail of the CSV-locked P2PKH redeem script from chapter 3:
+# OP_CHECKSEQUENCEVERIFY OP_DROP OP_DUP OP_HASH160 <push 20>
+_CSV_P2PKH_MID = b'\xb2\x75\x76\xa9\x14'
+# OP_EQUALVERIFY OP_CHECKSIG
+_CSV_P2PKH_TAIL = b'\x88\xac'
+
+
+def _push_script_num(n):
+    """Minimal push of a positive integer, as Script serializes it.
+
+    1 through 16 encode as OP_1..OP_16; larger values as a pushdata of
+    the little-endian ScriptNum bytes, zero-padded when the top bit
+    would read as a sign bit.
+    """
+    if 1 <= n <= 16:
+        return bytes([0x50 + n])
+    data = n.to_bytes((n.bit_length() + 7) // 8, 'little')
+    if data[-1] & 0x80:
+        data += b'\x00'
+    return bytes([len(data)]) + data
+
+
+def multisig_redeem(m, pubkeys):
+    """Serialize an m-of-n multisig redeem script directly to bytes.
+
+    `pubkeys` are compressed public keys as hex strings (as in the
+    chapter 3 examples). OP_1 through OP_16 encode as 0x50 + n, and a
+    33-byte compressed key needs a single-byte pushdata prefix.
+    """
+    n = len(pubkeys)
+    if not 1 <= m <= n <= 16:
+        raise ValueError(f"invalid multisig parameters: {m} of {n}")
+    parts = [bytes([0x50 + m])]
+    for pk in pubkeys:
+        key_bytes = bytes.fromhex(pk)
+        parts.append(bytes([len(key_bytes)]) + key_bytes)
+    parts.append(bytes([0x50 + n, OP_CHECKMULTISIG]))
+    return b''.join(parts)
+
+
+def csv_p2pkh_redeem(blocks, pubkey_hash):
+    """Serialize the CSV time-locked P2PKH redeem script to bytes.
+
+    `blocks` is the relative lock (as Sequence.for_script() yields for
+    block-based locks); `pubkey_hash` is the 20-byte hash160 of the
+    heir's public key. Only the lock push varies in length - the rest
+    of the template is constant.
+    """
+    return _push_script_num(blocks) + _CSV_P2PKH_MID + pubkey_hash + _CSV_P2PKH_TAIL
+
+
+if __name__ == "__main__":
+    from bitcoinutils.setup import setup
+    from bitcoinutils.script import Script
+
+    setup('testnet')
+
+    # The 2-of-3 stakeholder keys from chapter 3
+    alice_pk = '02898711e6bf63f5cbe1b38c05e89d6c391c59e9f8f695da44bf3d20ca674c8519'
+    bob_pk = '0284b5951609b76619a1ce7f48977b4312ebe226987166ef044bfb374ceef63af5'
+    carol_pk = '0317aa89b43f46a0c0cdbd9a302f2508337ba6a06d123854481b52de9c20996011'
+
+    raw = multisig_redeem(2, [alice_pk, bob_pk, carol_pk])
+    reference = Script([
+        'OP_2', alice_pk, bob_pk, carol_pk, 'OP_3', 'OP_CHECKMULTISIG'
+    ]).to_hex()
+
+    print(f"Direct bytes:  {raw.hex()}")
+    print(f"Script([...]): {reference}")
+    assert raw.hex() == reference
+
+    # CSV-locked P2PKH redeem, checked across push-width boundaries
+    from bitcoinutils.transactions import Sequence
+    from bitcoinutils.constants import TYPE_RELATIVE_TIMELOCK
+
+    pubkey_hash = bytes.fromhex('c5b28d6bba91a2693a9b1876bcd3929323890fb2')
+    for blocks in (3, 16, 100, 200, 1000):
+        seq = Sequence(TYPE_RELATIVE_TIMELOCK, blocks)
+        reference = Script([
+            seq.for_script(), 'OP_CHECKSEQUENCEVERIFY', 'OP_DROP', 'OP_DUP',
+            'OP_HASH160', pubkey_hash.hex(), 'OP_EQUALVERIFY', 'OP_CHECKSIG'
+        ]).to_hex()
+        assert csv_p2pkh_redeem(blocks, pubkey_hash).hex() == reference
+    print(f"CSV redeem (3 blocks): {csv_p2pkh_redeem(3, pubkey_hash).hex()}")
+    print("OK - builders match the library serialization")
@@ -0,0 +1,86 @@
+"""
+Witness Splicing for Two-Phase Serialization
+
+The chapter 4 and 5 creation scripts serialize a transaction twice:
+once unsigned for display, then again after the witness is attached -
+and the second serialize() re-encodes version, inputs, outputs and
+locktime even though none of them changed (scriptSig stays empty in
+SegWit; only the witness section is new). splice_witness reuses the
+Phase 1 bytes and inserts just the witness section, avoiding the full
+re-serialization.
+
+bitcoinutils already emits the marker/flag bytes (00 01) in the
+unsigned serialization when the transaction was built with
+has_segwit=True, so the witness section slots in directly before the
+final 4-byte locktime.
+
+Usage:
+    from txtools import splice_witness
+
+    unsigned = tx.serialize()              # Phase 1
+    sig = priv.sign_segwit_input(...)      # Phase 2
+    signed = splice_witness(unsigned, [[sig, pub.to_hex()]])
+"""
+
+
+def encode_varint(value):
+    """Serialize an integer as a Bitcoin varint."""
+    if value < 0xfd:
+        return bytes([value])
+    if value <= 0xffff:
+        return b'\xfd' + value.to_bytes(2, 'little')
+    if value <= 0xffffffff:
+        return b'\xfe' + value.to_bytes(4, 'little')
+    return b'\xff' + value.to_bytes(8, 'little')
+
+
+def splice_witness(unsigned_hex, witness_stacks):
+    """Insert witness stacks into an unsigned SegWit serialization.
+
+    `unsigned_hex` is the Phase 1 serialization of a transaction built
+    with has_segwit=True (marker/flag already present, empty witness).
+    `witness_stacks` is one stack per input, each a list of hex strings
+    or bytes, in input order - the same shape TxWitnessInput takes.
+    Returns the signed transaction hex.
+    """
+    body = bytes.fromhex(unsigned_hex)
+    parts = [body[:-4]]  # everything up to the locktime
+    for stack in witness_stacks:
+        parts.append(encode_varint(len(stack)))
+        for item in stack:
+            data = bytes.fromhex(item) if isinstance(item, str) else item
+            parts.append(encode_varint(len(data)))
+            parts.append(data)
+    parts.append(body[-4:])
+    return b''.join(parts).hex()
+
+
+if __name__ == "__main__":
+    from bitcoinutils.setup import setup
+    from bitcoinutils.keys import PrivateKey, P2wpkhAddress
+    from bitcoinutils.transactions import (Transaction, TxInput, TxOutput,
+                                           TxWitnessInput)
+
+    setup('testnet')
+
+    # Rebuild the chapter 4 transaction and splice instead of re-serializing
+    private_key = PrivateKey('cPeon9fBsW2BxwJTALj3hGzh9vm8C52Uqsce7MzXGS1iFJkPF4AT')
+    public_key = private_key.get_public_key()
+    to_address = P2wpkhAddress('tb1qckeg66a6jx3xjw5mrpmte5ujjv3cjrajtvm9r4')
+
+    txin = TxInput('1454438e6f417d710333fbab118058e2972127bdd790134ab74937fa9dddbc48', 0)
+    txout = TxOutput(666, to_address.to_script_pub_key())
+    tx = Transaction([txin], [txout], has_segwit=True)
+
+    unsigned_tx = tx.serialize()
+    script_code = public_key.get_address().to_script_pub_key()
+    signature = private_key.sign_segwit_input(tx, 0, script_code, 1000)
+
+    spliced = splice_witness(unsigned_tx, [[signature, public_key.to_hex()]])
+
+    tx.witnesses.append(TxWitnessInput([signature, public_key.to_hex()]))
+    assert spliced == tx.serialize()
+
+    print(f"Unsigned ({len(unsigned_tx) // 2} bytes): {unsigned_tx}")
+    print(f"Spliced  ({len(spliced) // 2} bytes): {spliced}")
+    print("OK - spliced serialization matches tx.serialize()")